@@ -1,5 +1,8 @@
 """Speech-to-Text application for converting iPhone audio recordings to text."""
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .audio_processor import AudioProcessor
 from .config import ConfigManager, AppConfig, get_config_manager, load_config, save_config
 from .error_handler import ErrorHandler
@@ -18,10 +21,12 @@ from .exceptions import (
 )
 from .file_manager import FileManager
 from .logger import SpeechToTextLogger, PerformanceMonitor, get_logger, setup_logging
-from .main_app import SpeechToTextApp
 from .models import TranscriptionResult, AudioFileInfo
 from .text_exporter import TextExporter
-from .transcriber import SpeechTranscriber
+
+if TYPE_CHECKING:
+    from .main_app import SpeechToTextApp
+    from .transcriber import SpeechTranscriber
 
 __version__ = "0.1.0"
 __author__ = "Speech-to-Text Developer"
@@ -56,4 +61,28 @@ __all__ = [
     "SystemError",
     "FileSystemError",
     "DiskSpaceError",
-]
\ No newline at end of file
+]
+
+# Names whose modules import Whisper (and with it torch). They are loaded on
+# first access so that importing the package, e.g. for the models or the
+# config, stays fast.
+_LAZY_IMPORTS = {
+    "SpeechToTextApp": ".main_app",
+    "SpeechTranscriber": ".transcriber",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    """List lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
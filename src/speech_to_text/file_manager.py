@@ -7,7 +7,7 @@ managing output directories, and generating output filenames.
 
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 from datetime import datetime
 
 from .audio_processor import AudioProcessor
@@ -22,14 +22,18 @@ class FileManager:
     and generating appropriate output filenames.
     """
     
-    def __init__(self, audio_processor: Optional[AudioProcessor] = None):
+    def __init__(self, audio_processor: Optional[AudioProcessor] = None,
+                 now: Optional[Callable[[], datetime]] = None):
         """
         Initialize FileManager.
         
         Args:
             audio_processor: Optional AudioProcessor instance for file validation
+            now: Optional clock used to timestamp output filenames
+                 (default: datetime.now)
         """
         self.audio_processor = audio_processor or AudioProcessor()
+        self._now = now or datetime.now
     
     def find_audio_files(self, directory: str, recursive: bool = True) -> List[str]:
         """
@@ -125,7 +129,7 @@ class FileManager:
                 extension = f".{extension}"
             
             # Always add transcription suffix with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d%H%M")
+            timestamp = self._now().strftime("%Y%m%d%H%M")
             transcription_suffix = f"_transcription_{timestamp}"
 
             # Add transcription suffix to base name
@@ -17,24 +17,39 @@ import json
 from datetime import datetime
 from contextlib import contextmanager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class PerformanceMonitor:
     """Monitor and track performance metrics."""
     
-    def __init__(self):
+    def __init__(self, clock: Optional[Callable[[], float]] = None):
+        """
+        Initialize the performance monitor.
+        
+        Args:
+            clock: Optional callable returning the current time in seconds
+                   (default: time.perf_counter, a monotonic high-resolution
+                   clock suited to measuring durations)
+        """
         self.metrics = {}
         self.start_times = {}
+        self._clock = clock or time.perf_counter
     
     def start_timer(self, operation: str) -> None:
         """Start timing an operation."""
-        self.start_times[operation] = time.time()
+        self.start_times[operation] = self._clock()
     
     def end_timer(self, operation: str) -> float:
         """End timing an operation and return duration."""
         if operation not in self.start_times:
             return 0.0
         
-        duration = time.time() - self.start_times[operation]
+        duration = self._clock() - self.start_times[operation]
         del self.start_times[operation]
         
         # Store metrics
@@ -64,7 +79,15 @@ class PerformanceMonitor:
 
 
 class StructuredFormatter(logging.Formatter):
-    """Custom formatter for structured logging."""
+    """
+    Custom formatter for structured logging.
+    
+    Records are serialized with orjson when it is installed. Its output is
+    valid JSON but differs in form from the json module's: lines have no
+    spaces after separators, and NaN and infinite floats become null.
+    Records orjson cannot serialize, such as integers wider than 64 bits,
+    fall back to the json module.
+    """
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
@@ -86,14 +109,74 @@ class StructuredFormatter(logging.Formatter):
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
         
+        if ORJSON_AVAILABLE:
+            try:
+                # orjson always emits UTF-8, matching ensure_ascii=False below
+                return orjson.dumps(
+                    log_data,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ).decode('utf-8')
+            except orjson.JSONEncodeError:
+                pass
+        
         return json.dumps(log_data, ensure_ascii=False)
 
 
+class BatchedMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    Memory handler that writes its buffered records to a file in one batch.
+    
+    The stock MemoryHandler passes records to its target one at a time, so a
+    file target still writes and flushes once per record. This handler
+    formats the buffer with the target's formatter and writes the joined
+    text to the target's stream with a single write and flush.
+    """
+    
+    def flush(self) -> None:
+        """Write all buffered records to the target file handler at once."""
+        self.acquire()
+        try:
+            target = self.target
+            if target is None or not self.buffer:
+                return
+            
+            try:
+                batch = ''.join(
+                    target.format(record) + target.terminator
+                    for record in self.buffer
+                    if target.filter(record)
+                )
+                target.acquire()
+                try:
+                    if target.stream is None:
+                        target.stream = target._open()
+                    # Rotate before the batch, as RotatingFileHandler does per record
+                    max_bytes = getattr(target, 'maxBytes', 0)
+                    if max_bytes > 0:
+                        target.stream.seek(0, 2)
+                        if target.stream.tell() + len(batch) >= max_bytes:
+                            target.doRollover()
+                    target.stream.write(batch)
+                    target.stream.flush()
+                finally:
+                    target.release()
+            except Exception:
+                self.handleError(self.buffer[-1])
+            self.buffer.clear()
+        finally:
+            self.release()
+
+
 class SpeechToTextLogger:
     """
     Comprehensive logging system for the speech-to-text application.
     """
     
+    WRITE_MODES = ("direct", "buffered")
+    
+    # Number of records held in memory before a buffered file write
+    BUFFER_CAPACITY = 1024
+    
     def __init__(self, 
                  name: str = "speech_to_text",
                  log_level: str = "INFO",
@@ -101,7 +184,8 @@ class SpeechToTextLogger:
                  enable_console: bool = True,
                  enable_file: bool = True,
                  enable_structured: bool = False,
-                 debug_mode: bool = False):
+                 debug_mode: bool = False,
+                 write_mode: str = "direct"):
         """
         Initialize the logging system.
         
@@ -113,7 +197,18 @@ class SpeechToTextLogger:
             enable_file: Enable file logging
             enable_structured: Enable structured JSON logging
             debug_mode: Enable debug mode with verbose logging
+            write_mode: How records reach the log file: "direct" writes each
+                        record immediately, "buffered" keeps up to
+                        BUFFER_CAPACITY records in memory and writes them in
+                        one batch when the buffer fills, an ERROR is logged,
+                        or the logger is closed
+        
+        Raises:
+            ValueError: If write_mode is not one of WRITE_MODES
         """
+        if write_mode not in self.WRITE_MODES:
+            raise ValueError(f"Invalid write mode: {write_mode}. Valid options: {list(self.WRITE_MODES)}")
+        
         self.name = name
         self.log_level = getattr(logging, log_level.upper())
         self.log_dir = Path(log_dir) if log_dir else Path("./logs")
@@ -121,6 +216,7 @@ class SpeechToTextLogger:
         self.enable_file = enable_file
         self.enable_structured = enable_structured
         self.debug_mode = debug_mode
+        self.write_mode = write_mode
         
         # Create performance monitor
         self.performance_monitor = PerformanceMonitor()
@@ -179,7 +275,14 @@ class SpeechToTextLogger:
                 file_format = '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(funcName)s:%(lineno)d - %(message)s'
                 file_handler.setFormatter(logging.Formatter(file_format))
             
-            logger.addHandler(file_handler)
+            if self.write_mode == "buffered":
+                buffered_handler = BatchedMemoryHandler(
+                    self.BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+                )
+                buffered_handler.setLevel(self.log_level)
+                logger.addHandler(buffered_handler)
+            else:
+                logger.addHandler(file_handler)
         
         # Error file handler (always enabled if file logging is enabled)
         if self.enable_file:
@@ -234,7 +337,6 @@ class SpeechToTextLogger:
     def timer(self, operation: str, log_result: bool = True):
         """Context manager for timing operations."""
         self.performance_monitor.start_timer(operation)
-        start_time = time.time()
         
         try:
             if self.debug_mode:
@@ -370,7 +472,8 @@ class SpeechToTextLogger:
             enable_console=self.enable_console,
             enable_file=self.enable_file,
             enable_structured=self.enable_structured,
-            debug_mode=self.debug_mode
+            debug_mode=self.debug_mode,
+            write_mode=self.write_mode
         )
     
     def close(self) -> None:
@@ -381,9 +484,12 @@ class SpeechToTextLogger:
             'session_duration': time.time() - self.session_start
         })
         
-        # Close all handlers
+        # Close all handlers, including the file handler behind a buffer
         for handler in self.logger.handlers[:]:
+            target = getattr(handler, 'target', None)
             handler.close()
+            if target is not None:
+                target.close()
             self.logger.removeHandler(handler)
 
 
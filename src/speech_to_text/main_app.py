@@ -7,7 +7,9 @@ management and error handling.
 """
 
 import gc
+import itertools
 import os
+import shutil
 import tempfile
 import threading
 from pathlib import Path
@@ -32,18 +34,24 @@ class TempFileManager:
         self._temp_files: List[str] = []
         self._lock = threading.Lock()
         self._temp_dir = None
+        self._name_counter = itertools.count()
     
     def create_temp_file(self, suffix: str = "", prefix: str = "stt_") -> str:
-        """Create a temporary file and track it for cleanup."""
+        """
+        Create a temporary file and track it for cleanup.
+        
+        Files are created in a private directory (mode 0700, from mkdtemp),
+        so names come from a simple counter instead of mkstemp's random
+        name search; O_EXCL still guards against reusing an existing name.
+        """
         with self._lock:
             if self._temp_dir is None:
                 self._temp_dir = tempfile.mkdtemp(prefix="speech_to_text_")
             
-            fd, temp_path = tempfile.mkstemp(
-                suffix=suffix, 
-                prefix=prefix, 
-                dir=self._temp_dir
+            temp_path = os.path.join(
+                self._temp_dir, f"{prefix}{next(self._name_counter)}{suffix}"
             )
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
             os.close(fd)  # Close file descriptor, we just need the path
             
             self._temp_files.append(temp_path)
@@ -52,18 +60,10 @@ class TempFileManager:
     def cleanup(self) -> None:
         """Clean up all tracked temporary files and directories."""
         with self._lock:
-            for temp_file in self._temp_files:
-                try:
-                    if os.path.exists(temp_file):
-                        os.unlink(temp_file)
-                except Exception:
-                    pass  # Ignore cleanup errors
-            
-            if self._temp_dir and os.path.exists(self._temp_dir):
-                try:
-                    os.rmdir(self._temp_dir)
-                except Exception:
-                    pass  # Ignore cleanup errors
+            # Every tracked file lives in the private directory, so removing
+            # the directory tree drops them all in one call (ignoring errors)
+            if self._temp_dir:
+                shutil.rmtree(self._temp_dir, ignore_errors=True)
             
             self._temp_files.clear()
             self._temp_dir = None
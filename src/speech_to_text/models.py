@@ -6,12 +6,18 @@ for representing transcription results, audio file information, and other
 core data structures.
 """
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+# Store result fields in __slots__ rather than a per-instance __dict__ where
+# dataclasses support it (Python 3.10+); batch runs keep many of these alive
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TranscriptionResult:
     """
     Represents the result of a speech-to-text transcription operation.
@@ -54,7 +60,7 @@ class TranscriptionResult:
             raise TypeError("timestamp must be a datetime object")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AudioFileInfo:
     """
     Contains metadata information about an audio file.
@@ -6,6 +6,10 @@ to various text formats with proper encoding and metadata support.
 """
 
 import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -13,6 +17,42 @@ from datetime import datetime
 from .models import TranscriptionResult
 from .exceptions import FileSystemError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Layout of the metadata header written above transcribed text
+_METADATA_TEMPLATE = (
+    "=" * 50 + "\n"
+    "TRANSCRIPTION METADATA\n"
+    + "=" * 50 + "\n"
+    "{fields}"
+    + "=" * 50 + "\n"
+    "\n"
+    "TRANSCRIBED TEXT:\n"
+    + "-" * 20 + "\n"
+    "{text}"
+)
+
+
+def _orjson_formats_like_json(value: float) -> bool:
+    """
+    Check whether orjson writes a float exactly as the json module does.
+    
+    The two differ for exponent notation (orjson writes ``1e-7`` where json
+    writes ``1e-07``) and for non-finite values, which orjson writes as null.
+    
+    Args:
+        value: Float value about to be serialized
+        
+    Returns:
+        True if both serializers produce the same text for the value
+    """
+    return math.isfinite(value) and 'e' not in repr(value)
+
 
 class TextExporter:
     """
@@ -24,6 +64,9 @@ class TextExporter:
     
     DEFAULT_ENCODING = 'utf-8'
     
+    # Upper bound on threads used to write batch results concurrently
+    MAX_SAVE_WORKERS = 8
+    
     def __init__(self, encoding: str = DEFAULT_ENCODING):
         """
         Initialize TextExporter.
@@ -52,10 +95,8 @@ class TextExporter:
             FileSystemError: If file saving fails
         """
         try:
-            output_file = Path(output_path)
-            
-            # Ensure output directory exists
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            # Resolve the path and ensure its output directory exists
+            output_file = self._prepare_output_file(output_path)
             
             # Prepare content
             content = text
@@ -64,10 +105,9 @@ class TextExporter:
                 content = self._add_metadata_to_text(text, metadata)
             
             # Write file with proper encoding
-            with open(output_file, 'w', encoding=self.encoding) as f:
-                f.write(content)
+            self._write_text(output_file, content)
             
-            return str(output_file.resolve())
+            return str(output_file)
             
         except Exception as e:
             raise FileSystemError(f"Failed to save text file {output_path}: {str(e)}")
@@ -90,7 +130,8 @@ class TextExporter:
             FileSystemError: If file saving fails
         """
         try:
-            metadata = self._extract_metadata_from_result(result)
+            # Metadata is only needed for the header
+            metadata = self._extract_metadata_from_result(result) if include_metadata else None
             
             return self.save_as_txt(
                 text=result.transcribed_text,
@@ -133,10 +174,8 @@ class TextExporter:
             FileSystemError: If file saving fails
         """
         try:
-            output_file = Path(output_path)
-            
-            # Ensure output directory exists
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            # Resolve the path and ensure its output directory exists
+            output_file = self._prepare_output_file(output_path)
             
             # Convert result to dictionary
             result_dict = {
@@ -149,11 +188,21 @@ class TextExporter:
                 'error_message': result.error_message
             }
             
-            # Write JSON file
-            with open(output_file, 'w', encoding=self.encoding) as f:
-                json.dump(result_dict, f, indent=2, ensure_ascii=False)
+            # Write JSON file; orjson is only used when its output matches the
+            # json module's, so files do not depend on the optional backend
+            if ORJSON_AVAILABLE and all(
+                _orjson_formats_like_json(value)
+                for value in (result.confidence_score, result.processing_time)
+            ):
+                # orjson emits UTF-8 bytes, matching ensure_ascii=False below
+                data = orjson.dumps(result_dict, option=orjson.OPT_INDENT_2)
+                self._write_text(output_file, data.decode('utf-8'))
+            else:
+                self._write_text(
+                    output_file, json.dumps(result_dict, indent=2, ensure_ascii=False)
+                )
             
-            return str(output_file.resolve())
+            return str(output_file)
             
         except Exception as e:
             raise FileSystemError(f"Failed to save JSON file {output_path}: {str(e)}")
@@ -174,19 +223,16 @@ class TextExporter:
             FileSystemError: If report creation fails
         """
         try:
-            output_file = Path(output_path)
-            
-            # Ensure output directory exists
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            # Resolve the path and ensure its output directory exists
+            output_file = self._prepare_output_file(output_path)
             
             # Generate summary content
             summary_content = self._generate_summary_content(results)
             
             # Write summary file
-            with open(output_file, 'w', encoding=self.encoding) as f:
-                f.write(summary_content)
+            self._write_text(output_file, summary_content)
             
-            return str(output_file.resolve())
+            return str(output_file)
             
         except Exception as e:
             raise FileSystemError(f"Failed to create summary report {output_path}: {str(e)}")
@@ -212,22 +258,36 @@ class TextExporter:
             output_directory = Path(output_dir)
             output_directory.mkdir(parents=True, exist_ok=True)
             
+            # Pair each successful result with its output path, skipping
+            # failed transcriptions. Results whose files share a stem map to
+            # the same path, so they are grouped and written in input order.
+            tasks = [
+                (
+                    result,
+                    str(output_directory / f"{Path(result.original_file).stem}_transcription.txt")
+                )
+                for result in results
+                if not result.error_message
+            ]
+            groups: Dict[str, List[TranscriptionResult]] = {}
+            for result, output_path in tasks:
+                groups.setdefault(output_path, []).append(result)
+            
+            def save_group(output_path: str) -> str:
+                for result in groups[output_path]:
+                    saved_path = self.save_transcription_result(result, output_path)
+                return saved_path
+            
             saved_files = {}
             
-            # Save individual results
-            for result in results:
-                if result.error_message:
-                    # Skip failed transcriptions
-                    continue
-                
-                # Generate output filename
-                original_name = Path(result.original_file).stem
-                output_filename = f"{original_name}_transcription.txt"
-                output_path = output_directory / output_filename
-                
-                # Save the result
-                saved_path = self.save_transcription_result(result, str(output_path))
-                saved_files[result.original_file] = saved_path
+            # Save each output path concurrently; file writes release the GIL.
+            # saved_files is filled from tasks, so it keeps input order.
+            if tasks:
+                max_workers = min(self.MAX_SAVE_WORKERS, len(groups))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    saved_paths = dict(zip(groups, executor.map(save_group, groups)))
+                for result, output_path in tasks:
+                    saved_files[result.original_file] = saved_paths[output_path]
             
             # Create summary report if requested
             if create_summary:
@@ -240,6 +300,31 @@ class TextExporter:
         except Exception as e:
             raise FileSystemError(f"Failed to save batch results to {output_dir}: {str(e)}")
     
+    def _prepare_output_file(self, output_path: str) -> Path:
+        """
+        Resolve an output file path and make sure its directory exists.
+        
+        Args:
+            output_path: Path of the file about to be written
+            
+        Returns:
+            Absolute, resolved path of the output file
+        """
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        return output_file.resolve()
+    
+    def _write_text(self, output_file: Path, content: str) -> None:
+        """
+        Write text content to a file in the exporter's encoding.
+        
+        Args:
+            output_file: Path of the file to write
+            content: Text content to write
+        """
+        with open(output_file, 'w', encoding=self.encoding) as f:
+            f.write(content)
+    
     def _extract_metadata_from_result(self, result: TranscriptionResult) -> Dict[str, Any]:
         """
         Extract metadata from TranscriptionResult.
@@ -255,7 +340,10 @@ class TextExporter:
             'language': result.language,
             'confidence_score': result.confidence_score,
             'processing_time': result.processing_time,
-            'timestamp': result.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+            # Same text as strftime('%Y-%m-%d %H:%M:%S'); dropping tzinfo
+            # keeps isoformat from appending a UTC offset
+            'timestamp': result.timestamp.replace(tzinfo=None).isoformat(
+                sep=' ', timespec='seconds'),
             'error_message': result.error_message
         }
     
@@ -270,25 +358,18 @@ class TextExporter:
         Returns:
             Text with metadata header
         """
-        header_lines = [
-            "=" * 50,
-            "TRANSCRIPTION METADATA",
-            "=" * 50
-        ]
-        
-        for key, value in metadata.items():
-            if value is not None:
-                header_lines.append(f"{key.replace('_', ' ').title()}: {value}")
+        fields = "".join(
+            f"{key.replace('_', ' ').title()}: {value}\n"
+            for key, value in metadata.items()
+            if value is not None
+        )
         
-        header_lines.extend([
-            "=" * 50,
-            "",
-            "TRANSCRIBED TEXT:",
-            "-" * 20,
-            ""
-        ])
+        # With every value None there is nothing to report; save_as_txt
+        # likewise writes no header for empty metadata
+        if not fields:
+            return text
         
-        return "\n".join(header_lines) + text
+        return _METADATA_TEMPLATE.format(fields=fields, text=text)
     
     def _generate_summary_content(self, results: List[TranscriptionResult]) -> str:
         """
@@ -303,15 +384,20 @@ class TextExporter:
         if not results:
             return "No transcription results to summarize.\n"
         
+        # Decide success once per result and reuse it for the file details
+        ok_flags = [not r.error_message for r in results]
+        successful = list(compress(results, ok_flags))
+        
         # Calculate statistics
         total_files = len(results)
-        successful_files = len([r for r in results if not r.error_message])
+        successful_files = len(successful)
         failed_files = total_files - successful_files
         
-        total_processing_time = sum(r.processing_time for r in results if not r.error_message)
-        avg_processing_time = total_processing_time / successful_files if successful_files > 0 else 0
+        total_processing_time = sum(r.processing_time for r in successful)
+        total_confidence = sum(r.confidence_score for r in successful)
         
-        avg_confidence = sum(r.confidence_score for r in results if not r.error_message) / successful_files if successful_files > 0 else 0
+        avg_processing_time = total_processing_time / successful_files if successful_files > 0 else 0
+        avg_confidence = total_confidence / successful_files if successful_files > 0 else 0
         
         # Generate report
         report_lines = [
@@ -335,21 +421,21 @@ class TextExporter:
         ]
         
         # Add individual file details
-        for i, result in enumerate(results, 1):
-            status = "SUCCESS" if not result.error_message else "FAILED"
-            file_name = Path(result.original_file).name
-            
-            report_lines.append(f"{i:3d}. {file_name}")
-            report_lines.append(f"     Status: {status}")
-            
-            if not result.error_message:
-                report_lines.append(f"     Language: {result.language}")
-                report_lines.append(f"     Confidence: {result.confidence_score:.3f}")
-                report_lines.append(f"     Processing time: {result.processing_time:.2f}s")
-                report_lines.append(f"     Text length: {len(result.transcribed_text)} characters")
+        for i, (result, ok) in enumerate(zip(results, ok_flags), 1):
+            report_lines.extend((
+                f"{i:3d}. {os.path.basename(result.original_file)}",
+                f"     Status: {'SUCCESS' if ok else 'FAILED'}"
+            ))
+            
+            if ok:
+                report_lines.extend((
+                    f"     Language: {result.language}",
+                    f"     Confidence: {result.confidence_score:.3f}",
+                    f"     Processing time: {result.processing_time:.2f}s",
+                    f"     Text length: {len(result.transcribed_text)} characters",
+                    ""
+                ))
             else:
-                report_lines.append(f"     Error: {result.error_message}")
-            
-            report_lines.append("")
+                report_lines.extend((f"     Error: {result.error_message}", ""))
         
         return "\n".join(report_lines)
\ No newline at end of file
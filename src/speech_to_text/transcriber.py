@@ -5,7 +5,9 @@ This module provides the SpeechTranscriber class that handles loading
 Whisper models and performing transcription operations on audio files.
 """
 
+import functools
 import gc
+import os
 import time
 import threading
 from datetime import datetime
@@ -18,8 +20,33 @@ from .exceptions import ModelLoadError, TranscriptionError
 from .models import TranscriptionResult
 
 
+# Model sizes that have been loaded into the cache below. lru_cache does not
+# expose its keys, so they are tracked alongside it for get_cache_info().
+# Only updated while holding _model_load_lock.
+_cached_model_sizes: List[str] = []
+
+# Guards the cache and _cached_model_sizes so concurrent requests for one
+# model load it once and the two stay in step
+_model_load_lock = threading.Lock()
+
+
+# Unbounded: keys are limited to SpeechTranscriber.AVAILABLE_MODELS, and an
+# eviction would leave _cached_model_sizes out of step with the cache
+@functools.lru_cache(maxsize=None)
+def _load_model_cached(model_size: str):
+    """Load a Whisper model, memoized on the model size."""
+    return whisper.load_model(model_size)
+
+
 class ModelCache:
-    """Thread-safe cache for Whisper models to avoid reloading."""
+    """
+    Process-wide cache for Whisper models to avoid reloading.
+    
+    Models are memoized by a module-level ``functools.lru_cache``. Lookups
+    take a lock so each model is only loaded once, even when several
+    threads ask for it at the same time. The class is kept as a singleton
+    facade for API compatibility.
+    """
     
     _instance = None
     _lock = threading.Lock()
@@ -29,32 +56,32 @@ class ModelCache:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
-                    cls._instance._cache = {}
-                    cls._instance._cache_lock = threading.Lock()
         return cls._instance
     
     def get_model(self, model_size: str):
         """Get cached model or load if not cached."""
-        with self._cache_lock:
-            if model_size not in self._cache:
-                try:
-                    self._cache[model_size] = whisper.load_model(model_size)
-                except Exception as e:
-                    raise ModelLoadError(model_size, str(e))
-            return self._cache[model_size]
+        try:
+            with _model_load_lock:
+                model = _load_model_cached(model_size)
+                if model_size not in _cached_model_sizes:
+                    _cached_model_sizes.append(model_size)
+                return model
+        except Exception as e:
+            raise ModelLoadError(model_size, str(e))
     
     def clear_cache(self):
         """Clear all cached models to free memory."""
-        with self._cache_lock:
-            self._cache.clear()
-            gc.collect()
+        with _model_load_lock:
+            _load_model_cached.cache_clear()
+            _cached_model_sizes.clear()
+        gc.collect()
     
     def get_cache_info(self) -> Dict[str, Any]:
         """Get information about cached models."""
-        with self._cache_lock:
+        with _model_load_lock:
             return {
-                "cached_models": list(self._cache.keys()),
-                "cache_size": len(self._cache)
+                "cached_models": list(_cached_model_sizes),
+                "cache_size": _load_model_cached.cache_info().currsize
             }
 
 
@@ -131,11 +158,42 @@ class SpeechTranscriber:
             TranscriptionError: If transcription fails
             FileNotFoundError: If the audio file doesn't exist
         """
-        audio_path = str(Path(audio_path).resolve())
+        return self._transcribe(
+            audio_path, language, optimize_memory, collect_garbage=optimize_memory
+        )
+    
+    def _transcribe(
+        self,
+        audio_path: str,
+        language: str,
+        optimize_memory: bool,
+        collect_garbage: bool
+    ) -> TranscriptionResult:
+        """
+        Transcribe a single audio file.
         
-        # Check if file exists
-        if not Path(audio_path).exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        Args:
+            audio_path: Path to the audio file to transcribe
+            language: Language code for transcription
+            optimize_memory: Whether to optimize memory usage during transcription
+            collect_garbage: Whether to run a full garbage collection afterwards;
+                             batch transcription passes False and collects every
+                             gc_frequency files instead
+            
+        Returns:
+            TranscriptionResult: Object containing transcription results and metadata
+            
+        Raises:
+            FileNotFoundError: If the audio file doesn't exist
+        """
+        # os.path.realpath resolves like Path.resolve() without its extra stat
+        audio_path = os.path.realpath(audio_path)
+        
+        # Check if file exists; the same stat result supplies the file size
+        try:
+            file_stat = Path(audio_path).stat()
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
         
         start_time = time.time()
         
@@ -148,8 +206,7 @@ class SpeechTranscriber:
             
             if optimize_memory:
                 # Use smaller chunk size for large files to reduce memory usage
-                file_size = Path(audio_path).stat().st_size
-                if file_size > 50 * 1024 * 1024:  # 50MB threshold
+                if file_stat.st_size > 50 * 1024 * 1024:  # 50MB threshold
                     transcribe_options.update({
                         "condition_on_previous_text": False,  # Reduce memory usage
                         "compression_ratio_threshold": 2.4,   # Skip low-quality segments
@@ -171,7 +228,8 @@ class SpeechTranscriber:
             # Force garbage collection for memory optimization
             if optimize_memory:
                 del result
-                gc.collect()
+                if collect_garbage:
+                    gc.collect()
             
             return TranscriptionResult(
                 original_file=audio_path,
@@ -186,7 +244,7 @@ class SpeechTranscriber:
             processing_time = time.time() - start_time
             
             # Force garbage collection on error
-            if optimize_memory:
+            if collect_garbage:
                 gc.collect()
             
             # Return a result with error information
@@ -230,8 +288,10 @@ class SpeechTranscriber:
             if progress_callback:
                 progress_callback(i, total_files, file_path)
             
-            # Transcribe the file with memory optimization
-            result = self.transcribe_file(file_path, language, optimize_memory)
+            # Transcribe the file; collection is batched via gc_frequency below
+            result = self._transcribe(
+                file_path, language, optimize_memory, collect_garbage=False
+            )
             results.append(result)
             
             # Periodic garbage collection for memory management
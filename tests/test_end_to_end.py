@@ -13,7 +13,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 from src.speech_to_text.main_app import SpeechToTextApp
-from src.speech_to_text.transcriber import SpeechTranscriber
+from src.speech_to_text.transcriber import SpeechTranscriber, ModelCache
 from src.speech_to_text.audio_processor import AudioProcessor
 from src.speech_to_text.models import TranscriptionResult
 from src.speech_to_text.exceptions import UnsupportedFormatError
@@ -24,6 +24,8 @@ class TestEndToEndWorkflow(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
+        # Models cached by other test modules would bypass the load_model patches
+        ModelCache().clear_cache()
         self.test_dir = tempfile.mkdtemp(prefix="e2e_test_")
         self.output_dir = os.path.join(self.test_dir, "output")
         
@@ -249,6 +251,8 @@ class TestKoreanLanguageAccuracy(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
+        # Models cached by other test modules would bypass the load_model patches
+        ModelCache().clear_cache()
         self.test_dir = tempfile.mkdtemp(prefix="korean_test_")
         self.korean_test_cases = [
             "안녕하세요",
@@ -352,6 +356,8 @@ class TestiPhoneRecordingFormats(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
+        # Models cached by other test modules would bypass the load_model patches
+        ModelCache().clear_cache()
         self.test_dir = tempfile.mkdtemp(prefix="iphone_test_")
         
         # iPhone recording formats and their characteristics
@@ -463,6 +469,8 @@ class TestPerformanceRegression(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
+        # Models cached by other test modules would bypass the load_model patches
+        ModelCache().clear_cache()
         self.test_dir = tempfile.mkdtemp(prefix="perf_regression_")
     
     def tearDown(self):
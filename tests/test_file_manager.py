@@ -6,10 +6,8 @@ creating output directories, and generating output filenames.
 """
 
 import os
-import tempfile
-import shutil
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch
 import pytest
 
 from src.speech_to_text.file_manager import FileManager
@@ -17,40 +15,73 @@ from src.speech_to_text.audio_processor import AudioProcessor
 from src.speech_to_text.exceptions import FileSystemError
 
 
-class TestFileManager:
-    """Test cases for FileManager class."""
+# Relative names of the files created by the audio_tree fixture
+_FIXTURE_NAMES = (
+    "test1.m4a",
+    "test2.wav",
+    "test3.mp3",
+    "not_audio.txt",
+    os.path.join("subdir", "sub_test.aac"),
+)
+
+
+def _fixed_now():
+    """Clock for FileManager that always returns 2023-12-01 14:30."""
+    return datetime(2023, 12, 1, 14, 30, 0)
+
+
+class _StubAudioProcessor:
+    """Minimal stand-in for AudioProcessor that finds no files."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.file_manager = FileManager()
-        
-        # Create test directory structure
-        self.test_audio_dir = Path(self.temp_dir) / "audio_files"
-        self.test_audio_dir.mkdir()
-        
-        self.test_output_dir = Path(self.temp_dir) / "output"
-        
-        # Create some test files
-        self.test_files = {
-            "test1.m4a": self.test_audio_dir / "test1.m4a",
-            "test2.wav": self.test_audio_dir / "test2.wav",
-            "test3.mp3": self.test_audio_dir / "test3.mp3",
-            "not_audio.txt": self.test_audio_dir / "not_audio.txt",
-        }
-        
-        for filename, filepath in self.test_files.items():
-            filepath.touch()
-        
-        # Create subdirectory with audio files
-        self.sub_dir = self.test_audio_dir / "subdir"
-        self.sub_dir.mkdir()
-        self.sub_audio_file = self.sub_dir / "sub_test.aac"
-        self.sub_audio_file.touch()
+    def find_audio_files(self, directory, recursive=True):
+        return []
+
+
+@pytest.fixture(scope="module")
+def file_manager():
+    """Share a single FileManager across the tests in this module."""
+    return FileManager()
+
+
+@pytest.fixture
+def audio_dir(base_dir):
+    """Path of the audio test directory (not created)."""
+    return base_dir / "audio_files"
+
+
+@pytest.fixture
+def audio_tree(audio_dir):
+    """Create the audio test directory structure and return its root."""
+    os.makedirs(audio_dir / "subdir")
+    
+    # Create empty test files, including one in the subdirectory
+    for name in _FIXTURE_NAMES:
+        os.close(os.open(audio_dir / name, os.O_CREAT | os.O_WRONLY, 0o600))
+    
+    return audio_dir
+
+
+@pytest.fixture
+def audio_file(audio_dir):
+    """Path of the single audio file most tests refer to (not created)."""
+    return audio_dir / "test1.m4a"
+
+
+@pytest.fixture
+def output_dir(base_dir):
+    """Path of the output directory (not created)."""
+    return base_dir / "output"
+
+
+class TestFileManagerPure:
+    """Test cases for FileManager path logic, run against an in-memory filesystem."""
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture
+    def base_dir(self, fs):
+        """Base directory on the fake filesystem."""
+        base_dir = Path("/fm-test")
+        base_dir.mkdir()
+        return base_dir
     
     def test_init_default_audio_processor(self):
         """Test FileManager initialization with default AudioProcessor."""
@@ -59,278 +90,243 @@ class TestFileManager:
     
     def test_init_custom_audio_processor(self):
         """Test FileManager initialization with custom AudioProcessor."""
-        mock_processor = Mock(spec=AudioProcessor)
-        fm = FileManager(audio_processor=mock_processor)
-        assert fm.audio_processor is mock_processor
+        stub_processor = _StubAudioProcessor()
+        fm = FileManager(audio_processor=stub_processor)
+        assert fm.audio_processor is stub_processor
     
-    def test_find_audio_files_recursive(self):
-        """Test finding audio files recursively."""
-        # Mock the audio processor to return our test files
+    @pytest.mark.parametrize("kwargs, error, expected_exception, expected_message", [
+        ({}, None, None, None),
+        ({"recursive": False}, None, None, None),
+        ({}, FileNotFoundError("Directory not found"), FileNotFoundError, "Directory not found"),
+        ({}, PermissionError("Access denied"), FileSystemError, "Failed to search directory"),
+    ], ids=["recursive", "non_recursive", "directory_not_found", "access_error"])
+    def test_find_audio_files(self, file_manager, audio_dir, monkeypatch,
+                              kwargs, error, expected_exception, expected_message):
+        """Test finding audio files delegates to AudioProcessor and maps errors."""
         expected_files = [
-            str(self.test_files["test1.m4a"]),
-            str(self.test_files["test2.wav"]),
-            str(self.test_files["test3.mp3"]),
-            str(self.sub_audio_file)
+            os.fspath(audio_dir / "test1.m4a"),
+            os.fspath(audio_dir / "test2.wav"),
+            os.fspath(audio_dir / "test3.mp3"),
         ]
+        calls = []
         
-        with patch.object(self.file_manager.audio_processor, 'find_audio_files') as mock_find:
-            mock_find.return_value = expected_files
-            
-            result = self.file_manager.find_audio_files(str(self.test_audio_dir))
-            
-            mock_find.assert_called_once_with(str(self.test_audio_dir), True)
-            assert result == expected_files
-    
-    def test_find_audio_files_non_recursive(self):
-        """Test finding audio files non-recursively."""
-        expected_files = [
-            str(self.test_files["test1.m4a"]),
-            str(self.test_files["test2.wav"]),
-            str(self.test_files["test3.mp3"])
-        ]
+        def fake_find(*args, **kwargs):
+            calls.append((args, kwargs))
+            if error is not None:
+                raise error
+            return expected_files
         
-        with patch.object(self.file_manager.audio_processor, 'find_audio_files') as mock_find:
-            mock_find.return_value = expected_files
-            
-            result = self.file_manager.find_audio_files(str(self.test_audio_dir), recursive=False)
-            
-            mock_find.assert_called_once_with(str(self.test_audio_dir), False)
+        monkeypatch.setattr(file_manager.audio_processor, "find_audio_files", fake_find)
+        
+        if expected_exception is None:
+            result = file_manager.find_audio_files(os.fspath(audio_dir), **kwargs)
             assert result == expected_files
+        else:
+            with pytest.raises(expected_exception, match=expected_message):
+                file_manager.find_audio_files(os.fspath(audio_dir), **kwargs)
+        
+        assert calls == [((os.fspath(audio_dir), kwargs.get("recursive", True)), {})]
     
-    def test_find_audio_files_directory_not_found(self):
-        """Test finding audio files in non-existent directory."""
-        non_existent_dir = str(Path(self.temp_dir) / "non_existent")
-        
-        with patch.object(self.file_manager.audio_processor, 'find_audio_files') as mock_find:
-            mock_find.side_effect = FileNotFoundError(f"Directory not found: {non_existent_dir}")
-            
-            with pytest.raises(FileNotFoundError):
-                self.file_manager.find_audio_files(non_existent_dir)
-    
-    def test_find_audio_files_access_error(self):
-        """Test finding audio files with access error."""
-        with patch.object(self.file_manager.audio_processor, 'find_audio_files') as mock_find:
-            mock_find.side_effect = PermissionError("Access denied")
-            
-            with pytest.raises(FileSystemError) as exc_info:
-                self.file_manager.find_audio_files(str(self.test_audio_dir))
-            
-            assert "Failed to search directory" in str(exc_info.value)
-    
-    def test_create_output_directory_new(self):
+    def test_create_output_directory_new(self, file_manager, output_dir):
         """Test creating a new output directory."""
-        output_path = str(self.test_output_dir)
+        output_path = os.fspath(output_dir)
         
-        result = self.file_manager.create_output_directory(output_path)
+        result = file_manager.create_output_directory(output_path)
         
-        assert result == str(self.test_output_dir.resolve())
-        assert self.test_output_dir.exists()
-        assert self.test_output_dir.is_dir()
+        assert Path(result) == output_dir.resolve()
+        assert output_dir.exists()
+        assert output_dir.is_dir()
     
-    def test_create_output_directory_existing(self):
+    def test_create_output_directory_existing(self, file_manager, output_dir):
         """Test creating output directory that already exists."""
-        self.test_output_dir.mkdir()
-        output_path = str(self.test_output_dir)
+        output_dir.mkdir()
+        output_path = os.fspath(output_dir)
         
-        result = self.file_manager.create_output_directory(output_path)
+        result = file_manager.create_output_directory(output_path)
         
-        assert result == str(self.test_output_dir.resolve())
-        assert self.test_output_dir.exists()
+        assert Path(result) == output_dir.resolve()
+        assert output_dir.exists()
     
-    def test_create_output_directory_nested(self):
+    def test_create_output_directory_nested(self, file_manager, output_dir):
         """Test creating nested output directories."""
-        nested_dir = self.test_output_dir / "nested" / "deep"
-        output_path = str(nested_dir)
+        nested_dir = output_dir / "nested" / "deep"
+        output_path = os.fspath(nested_dir)
         
-        result = self.file_manager.create_output_directory(output_path)
+        result = file_manager.create_output_directory(output_path)
         
-        assert result == str(nested_dir.resolve())
+        assert Path(result) == nested_dir.resolve()
         assert nested_dir.exists()
         assert nested_dir.is_dir()
     
-    def test_create_output_directory_permission_error(self):
-        """Test creating output directory with permission error."""
-        with patch('pathlib.Path.mkdir') as mock_mkdir:
-            mock_mkdir.side_effect = PermissionError("Permission denied")
-            
-            with pytest.raises(FileSystemError) as exc_info:
-                self.file_manager.create_output_directory(str(self.test_output_dir))
-            
-            assert "Failed to create output directory" in str(exc_info.value)
-    
-    def test_generate_output_filename_basic(self):
-        """Test generating basic output filename."""
-        input_path = str(self.test_files["test1.m4a"])
-        output_dir = str(self.test_output_dir)
-        self.test_output_dir.mkdir()
-        
-        result = self.file_manager.generate_output_filename(input_path, output_dir)
-        
-        expected = str(self.test_output_dir / "test1.txt")
-        assert result == expected
-    
-    def test_generate_output_filename_with_suffix(self):
-        """Test generating output filename with suffix."""
-        input_path = str(self.test_files["test1.m4a"])
-        output_dir = str(self.test_output_dir)
-        self.test_output_dir.mkdir()
-        
-        result = self.file_manager.generate_output_filename(
-            input_path, output_dir, suffix="transcribed"
-        )
-        
-        expected = str(self.test_output_dir / "test1_transcribed.txt")
-        assert result == expected
-    
-    def test_generate_output_filename_custom_extension(self):
-        """Test generating output filename with custom extension."""
-        input_path = str(self.test_files["test1.m4a"])
-        output_dir = str(self.test_output_dir)
-        self.test_output_dir.mkdir()
-        
-        result = self.file_manager.generate_output_filename(
-            input_path, output_dir, extension=".json"
-        )
-        
-        expected = str(self.test_output_dir / "test1.json")
-        assert result == expected
-    
-    def test_generate_output_filename_extension_without_dot(self):
-        """Test generating output filename with extension without dot."""
-        input_path = str(self.test_files["test1.m4a"])
-        output_dir = str(self.test_output_dir)
-        self.test_output_dir.mkdir()
-        
-        result = self.file_manager.generate_output_filename(
-            input_path, output_dir, extension="json"
-        )
-        
-        expected = str(self.test_output_dir / "test1.json")
-        assert result == expected
+    @pytest.mark.parametrize("kwargs, expected_name", [
+        ({}, "test1_transcription_202312011430.txt"),
+        ({"suffix": "transcribed"}, "test1_transcribed_transcription_202312011430.txt"),
+        ({"extension": ".json"}, "test1_transcription_202312011430.json"),
+        ({"extension": "json"}, "test1_transcription_202312011430.json"),
+    ])
+    def test_generate_output_filename(self, audio_file, output_dir, kwargs, expected_name):
+        """Test generating output filenames with optional suffix and extension."""
+        fm = FileManager(audio_processor=_StubAudioProcessor(), now=_fixed_now)
+        input_path = os.fspath(audio_file)
+        
+        result = fm.generate_output_filename(input_path, os.fspath(output_dir), **kwargs)
+        
+        assert Path(result) == output_dir / expected_name
     
-    def test_generate_output_filename_conflict_resolution(self):
-        """Test generating output filename with conflict resolution."""
-        input_path = str(self.test_files["test1.m4a"])
-        output_dir = str(self.test_output_dir)
-        self.test_output_dir.mkdir()
-        
-        # Create existing file
-        existing_file = self.test_output_dir / "test1.txt"
+    def test_generate_output_filename_ignores_existing_files(self, audio_file, output_dir):
+        """Test that an existing file with the input's stem does not change the name."""
+        fm = FileManager(audio_processor=_StubAudioProcessor(), now=_fixed_now)
+        input_path = os.fspath(audio_file)
+        output_dir.mkdir()
+        
+        # Names are unique through the timestamp alone; there is no conflict
+        # resolution, so other files in the output directory are not consulted
+        existing_file = output_dir / "test1.txt"
         existing_file.touch()
         
-        with patch('src.speech_to_text.file_manager.datetime') as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = "20231201_143000"
-            
-            result = self.file_manager.generate_output_filename(input_path, output_dir)
-            
-            expected = str(self.test_output_dir / "test1_20231201_143000.txt")
-            assert result == expected
+        result = fm.generate_output_filename(input_path, os.fspath(output_dir))
+        
+        assert Path(result) == output_dir / "test1_transcription_202312011430.txt"
     
-    def test_ensure_directory_exists(self):
+    def test_ensure_directory_exists(self, file_manager, output_dir):
         """Test ensuring directory exists for file path."""
-        file_path = str(self.test_output_dir / "subdir" / "file.txt")
+        file_path = os.fspath(output_dir / "subdir" / "file.txt")
         
-        result = self.file_manager.ensure_directory_exists(file_path)
+        result = file_manager.ensure_directory_exists(file_path)
         
-        expected_dir = str((self.test_output_dir / "subdir").resolve())
-        assert result == expected_dir
-        assert (self.test_output_dir / "subdir").exists()
+        assert Path(result) == (output_dir / "subdir").resolve()
+        assert (output_dir / "subdir").exists()
     
-    def test_get_file_size(self):
+    def test_get_file_size(self, file_manager, audio_tree):
         """Test getting file size."""
-        test_file = self.test_files["test1.m4a"]
+        test_file = audio_tree / "test1.m4a"
         test_content = b"test content"
         test_file.write_bytes(test_content)
         
-        result = self.file_manager.get_file_size(str(test_file))
+        result = file_manager.get_file_size(os.fspath(test_file))
         
         assert result == len(test_content)
     
-    def test_get_file_size_not_found(self):
+    def test_get_file_size_not_found(self, file_manager, base_dir):
         """Test getting file size for non-existent file."""
-        non_existent = str(Path(self.temp_dir) / "non_existent.txt")
+        non_existent = os.fspath(base_dir / "non_existent.txt")
         
         with pytest.raises(FileNotFoundError):
-            self.file_manager.get_file_size(non_existent)
+            file_manager.get_file_size(non_existent)
     
-    def test_get_file_size_not_file(self):
+    def test_get_file_size_not_file(self, file_manager, audio_tree):
         """Test getting file size for directory."""
         with pytest.raises(FileSystemError) as exc_info:
-            self.file_manager.get_file_size(str(self.test_audio_dir))
+            file_manager.get_file_size(os.fspath(audio_tree))
         
         assert "Path is not a file" in str(exc_info.value)
     
-    def test_is_valid_output_path_valid(self):
+    def test_is_valid_output_path_valid(self, file_manager, output_dir):
         """Test checking valid output path."""
-        self.test_output_dir.mkdir()
-        file_path = str(self.test_output_dir / "output.txt")
+        output_dir.mkdir()
+        file_path = os.fspath(output_dir / "output.txt")
         
-        result = self.file_manager.is_valid_output_path(file_path)
+        result = file_manager.is_valid_output_path(file_path)
         
         assert result is True
     
-    def test_is_valid_output_path_creates_directory(self):
+    def test_is_valid_output_path_creates_directory(self, file_manager, output_dir):
         """Test checking output path that requires directory creation."""
-        file_path = str(self.test_output_dir / "output.txt")
+        file_path = os.fspath(output_dir / "output.txt")
         
-        result = self.file_manager.is_valid_output_path(file_path)
+        result = file_manager.is_valid_output_path(file_path)
         
         assert result is True
-        assert self.test_output_dir.exists()
+        assert output_dir.exists()
     
-    def test_is_valid_output_path_invalid(self):
+    def test_is_valid_output_path_invalid(self, file_manager, base_dir):
         """Test checking invalid output path."""
         # Create a file where we want a directory
-        invalid_parent = self.test_output_dir.parent / "invalid_parent"
+        invalid_parent = base_dir / "invalid_parent"
         invalid_parent.touch()
-        file_path = str(invalid_parent / "output.txt")
+        file_path = os.fspath(invalid_parent / "output.txt")
         
-        result = self.file_manager.is_valid_output_path(file_path)
+        result = file_manager.is_valid_output_path(file_path)
         
         assert result is False
     
-    def test_cleanup_temp_files(self):
-        """Test cleaning up temporary files."""
-        temp_files = []
-        for i in range(3):
-            temp_file = Path(self.temp_dir) / f"temp_{i}.tmp"
-            temp_file.touch()
-            temp_files.append(str(temp_file))
-        
-        # Add non-existent file to test error handling
-        temp_files.append(str(Path(self.temp_dir) / "non_existent.tmp"))
-        
-        self.file_manager.cleanup_temp_files(temp_files)
-        
-        # Check that existing files were removed
-        for i in range(3):
-            temp_file = Path(self.temp_dir) / f"temp_{i}.tmp"
-            assert not temp_file.exists()
-    
-    def test_get_relative_path_related(self):
+    def test_get_relative_path_related(self, file_manager, audio_dir):
         """Test getting relative path for related paths."""
-        base_path = str(self.test_audio_dir)
-        file_path = str(self.test_files["test1.m4a"])
+        base_path = os.fspath(audio_dir)
+        file_path = os.fspath(audio_dir / "test1.m4a")
         
-        result = self.file_manager.get_relative_path(file_path, base_path)
+        result = file_manager.get_relative_path(file_path, base_path)
         
         assert result == "test1.m4a"
     
-    def test_get_relative_path_unrelated(self):
+    def test_get_relative_path_unrelated(self, file_manager, audio_file):
         """Test getting relative path for unrelated paths."""
         base_path = "/completely/different/path"
-        file_path = str(self.test_files["test1.m4a"])
-        
-        result = self.file_manager.get_relative_path(file_path, base_path)
+        result = file_manager.get_relative_path(os.fspath(audio_file), base_path)
         
         # Should return absolute path when paths are unrelated
-        assert result == str(Path(file_path).resolve())
+        assert Path(result) == audio_file.resolve()
     
-    def test_get_relative_path_error(self):
+    def test_get_relative_path_error(self, file_manager):
         """Test getting relative path with error."""
         # Test with invalid paths - should return the resolved absolute path
-        result = self.file_manager.get_relative_path("invalid_path", "invalid_base")
+        result = file_manager.get_relative_path("invalid_path", "invalid_base")
         
         # When paths can't be made relative, it returns the absolute path
-        expected = str(Path("invalid_path").resolve())
-        assert result == expected
\ No newline at end of file
+        assert Path(result) == Path("invalid_path").resolve()
+
+
+class TestFileManagerIO:
+    """Test cases for FileManager behavior that needs a real filesystem."""
+    
+    @pytest.fixture
+    def base_dir(self, tmp_path):
+        """Base directory in a real temporary directory."""
+        return tmp_path
+    
+    def test_create_output_directory_permission_error(self, file_manager, output_dir,
+                                                      monkeypatch):
+        """Test creating output directory with permission error."""
+        calls = []
+        
+        def fake_mkdir(path, *args, **kwargs):
+            calls.append(path)
+            raise PermissionError("Permission denied")
+        
+        monkeypatch.setattr(Path, "mkdir", fake_mkdir)
+        
+        with pytest.raises(FileSystemError) as exc_info:
+            file_manager.create_output_directory(os.fspath(output_dir))
+        
+        assert "Failed to create output directory" in str(exc_info.value)
+        assert calls == [output_dir.resolve()]
+    
+    def test_create_output_directory_follows_symlink_before_parent(self, file_manager,
+                                                                    base_dir):
+        """Test that '..' after a symlink is taken relative to the link target."""
+        (base_dir / "real" / "sub").mkdir(parents=True)
+        (base_dir / "a").mkdir()
+        (base_dir / "a" / "link").symlink_to(base_dir / "real" / "sub", target_is_directory=True)
+        
+        result = file_manager.create_output_directory(
+            os.path.join(base_dir, "a", "link", "..", "out")
+        )
+        
+        assert Path(result) == (base_dir / "real" / "out").resolve()
+        assert not (base_dir / "a" / "out").exists()
+    
+    def test_cleanup_temp_files(self, file_manager, base_dir):
+        """Test cleaning up temporary files."""
+        temp_names = [f"temp_{i}.tmp" for i in range(3)]
+        temp_files = [os.path.join(base_dir, name) for name in temp_names]
+        for temp_file in temp_files:
+            os.close(os.open(temp_file, os.O_CREAT | os.O_WRONLY, 0o600))
+        
+        # Add non-existent file to test error handling
+        temp_files.append(os.path.join(base_dir, "non_existent.tmp"))
+        
+        file_manager.cleanup_temp_files(temp_files)
+        
+        # Check that existing files were removed
+        remaining = set(os.listdir(base_dir))
+        assert remaining.isdisjoint(temp_names)
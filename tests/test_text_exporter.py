@@ -9,10 +9,11 @@ import json
 import tempfile
 import shutil
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 import pytest
 
+from src.speech_to_text import text_exporter as text_exporter_module
 from src.speech_to_text.text_exporter import TextExporter
 from src.speech_to_text.models import TranscriptionResult
 from src.speech_to_text.exceptions import FileSystemError
@@ -113,6 +114,37 @@ class TestTextExporter:
         assert nested_path.exists()
         assert nested_path.parent.exists()
     
+    def test_save_as_txt_follows_symlinks(self):
+        """Test that saves through a symlink return and write the resolved path."""
+        base_dir = Path(self.temp_dir)
+        (base_dir / "real" / "sub").mkdir(parents=True)
+        (base_dir / "a" / "o").mkdir(parents=True)
+        (base_dir / "a" / "link").symlink_to(base_dir / "real" / "sub")
+        (base_dir / "a" / "o" / "linked.txt").symlink_to(base_dir / "real" / "target.txt")
+        
+        # '..' after the symlink refers to the link target's parent
+        via_link = self.text_exporter.save_as_txt(
+            "first", str(base_dir / "a" / "link" / ".." / "o" / "f.txt"))
+        direct = self.text_exporter.save_as_txt(
+            "second", str(base_dir / "a" / "o" / "g.txt"))
+        linked_file = self.text_exporter.save_as_txt(
+            "third", str(base_dir / "a" / "o" / "linked.txt"))
+        
+        assert via_link == str((base_dir / "real" / "o" / "f.txt").resolve())
+        assert direct == str((base_dir / "a" / "o" / "g.txt").resolve())
+        assert linked_file == str((base_dir / "real" / "target.txt").resolve())
+        assert (base_dir / "real" / "target.txt").read_text(encoding='utf-8') == "third"
+    
+    def test_save_as_txt_recreates_removed_directory(self):
+        """Test that a save recreates an output directory removed after an earlier save."""
+        output_dir = Path(self.temp_dir) / "nested"
+        self.text_exporter.save_as_txt("first", str(output_dir / "a.txt"))
+        shutil.rmtree(output_dir)
+        
+        result_path = self.text_exporter.save_as_txt("second", str(output_dir / "b.txt"))
+        
+        assert Path(result_path).read_text(encoding='utf-8') == "second"
+    
     def test_save_as_txt_permission_error(self):
         """Test save_as_txt with permission error."""
         with patch('builtins.open', side_effect=PermissionError("Permission denied")):
@@ -127,12 +159,14 @@ class TestTextExporter:
         """Test saving TranscriptionResult to text file."""
         output_path = Path(self.temp_dir) / "transcription.txt"
         
-        result_path = self.text_exporter.save_transcription_result(
-            self.sample_result, str(output_path), include_metadata=False
-        )
+        with patch.object(self.text_exporter, '_extract_metadata_from_result') as mock_extract:
+            result_path = self.text_exporter.save_transcription_result(
+                self.sample_result, str(output_path), include_metadata=False
+            )
         
         assert result_path == str(output_path.resolve())
         assert output_path.exists()
+        mock_extract.assert_not_called()
         
         with open(output_path, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -193,6 +227,45 @@ class TestTextExporter:
         assert data['timestamp'] == self.sample_result.timestamp.isoformat()
         assert data['error_message'] == self.sample_result.error_message
     
+    @pytest.mark.parametrize("use_orjson", [
+        pytest.param(True, marks=pytest.mark.skipif(
+            not text_exporter_module.ORJSON_AVAILABLE, reason="orjson not installed")),
+        False,
+    ], ids=["orjson", "json"])
+    def test_save_as_json_backends(self, monkeypatch, use_orjson):
+        """Test both JSON backends write the same indented, unescaped output."""
+        monkeypatch.setattr(text_exporter_module, "ORJSON_AVAILABLE", use_orjson)
+        output_path = Path(self.temp_dir) / "transcription.json"
+        
+        self.text_exporter.save_as_json(self.sample_result, str(output_path))
+        
+        content = output_path.read_text(encoding='utf-8')
+        assert content == json.dumps(json.loads(content), indent=2, ensure_ascii=False)
+        assert self.sample_result.transcribed_text in content
+    
+    @pytest.mark.parametrize("use_orjson", [
+        pytest.param(True, marks=pytest.mark.skipif(
+            not text_exporter_module.ORJSON_AVAILABLE, reason="orjson not installed")),
+        False,
+    ], ids=["orjson", "json"])
+    @pytest.mark.parametrize("value, expected", [
+        (1e-7, "1e-07"),
+        (5e-05, "5e-05"),
+        (1e20, "1e+20"),
+        (float("nan"), "NaN"),
+        (0.95, "0.95"),
+    ])
+    def test_save_as_json_float_formatting(self, monkeypatch, use_orjson, value, expected):
+        """Test floats are written as the json module writes them with either backend."""
+        monkeypatch.setattr(text_exporter_module, "ORJSON_AVAILABLE", use_orjson)
+        output_path = Path(self.temp_dir) / "transcription.json"
+        self.sample_result.processing_time = value
+        
+        self.text_exporter.save_as_json(self.sample_result, str(output_path))
+        
+        content = output_path.read_text(encoding='utf-8')
+        assert f'"processing_time": {expected},' in content
+    
     def test_save_as_json_creates_directory(self):
         """Test that save_as_json creates output directory."""
         nested_path = Path(self.temp_dir) / "nested" / "transcription.json"
@@ -278,6 +351,56 @@ class TestTextExporter:
         summary_file = Path(saved_files['_summary'])
         assert summary_file.exists()
     
+    def test_save_batch_results_preserves_order(self):
+        """Test that concurrently saved batch results keep the input order."""
+        output_dir = Path(self.temp_dir) / "batch_output"
+        results = [
+            TranscriptionResult(
+                original_file=f"/path/to/audio_{i}.m4a",
+                transcribed_text=f"text {i}",
+                language="ko",
+                confidence_score=0.9,
+                processing_time=1.0,
+                timestamp=datetime(2023, 12, 1, 14, 30, 0)
+            )
+            for i in range(TextExporter.MAX_SAVE_WORKERS * 2)
+        ]
+        
+        saved_files = self.text_exporter.save_batch_results(
+            results, str(output_dir), create_summary=False
+        )
+        
+        assert list(saved_files) == [r.original_file for r in results]
+        for result in results:
+            assert Path(saved_files[result.original_file]).read_text(
+                encoding='utf-8').endswith(result.transcribed_text)
+    
+    def test_save_batch_results_shared_stem_keeps_last(self):
+        """Test that results sharing a file stem are written in order, last one winning."""
+        output_dir = Path(self.temp_dir) / "batch_output"
+        results = [
+            TranscriptionResult(
+                original_file=f"/path/dir{i}/rec.m4a",
+                transcribed_text=text,
+                language="ko",
+                confidence_score=0.9,
+                processing_time=1.0,
+                timestamp=datetime(2023, 12, 1, 14, 30, 0)
+            )
+            for i, text in enumerate(["long text " * 1000, "short text"] * 4)
+        ]
+        
+        saved_files = self.text_exporter.save_batch_results(
+            results, str(output_dir), create_summary=False
+        )
+        
+        assert list(saved_files) == [r.original_file for r in results]
+        assert len(set(saved_files.values())) == 1
+        content = Path(saved_files[results[-1].original_file]).read_text(encoding='utf-8')
+        assert f"Original File: {results[-1].original_file}" in content
+        assert content.endswith("-\nshort text")
+        assert "long text" not in content
+    
     def test_save_batch_results_with_failures(self):
         """Test saving batch results with some failures."""
         output_dir = Path(self.temp_dir) / "batch_output"
@@ -315,6 +438,15 @@ class TestTextExporter:
         assert metadata['timestamp'] == "2023-12-01 14:30:00"
         assert metadata['error_message'] == self.sample_result.error_message
     
+    def test_extract_metadata_timezone_aware_timestamp(self):
+        """Test that aware timestamps are formatted without a UTC offset."""
+        self.sample_result.timestamp = datetime(
+            2023, 12, 1, 14, 30, 0, 123456, tzinfo=timezone(timedelta(hours=9)))
+        
+        metadata = self.text_exporter._extract_metadata_from_result(self.sample_result)
+        
+        assert metadata['timestamp'] == "2023-12-01 14:30:00"
+    
     def test_add_metadata_to_text(self):
         """Test adding metadata header to text."""
         text = "Original text content"
@@ -348,6 +480,15 @@ class TestTextExporter:
         assert "Language: ko" in result
         assert "Error Message: None" not in result  # None values should be skipped
     
+    def test_add_metadata_to_text_all_none_values(self):
+        """Test that metadata with only None values adds no header."""
+        text = "Original text content"
+        metadata = {'error_message': None, 'language': None}
+        
+        result = self.text_exporter._add_metadata_to_text(text, metadata)
+        
+        assert result == text
+    
     def test_generate_summary_content_empty(self):
         """Test generating summary content with empty results."""
         content = self.text_exporter._generate_summary_content([])
@@ -381,4 +522,12 @@ class TestTextExporter:
         with open(output_path, 'r', encoding='utf-16') as f:
             content = f.read()
         
-        assert content == test_text
\ No newline at end of file
+        assert content == test_text
+    
+    def test_unknown_encoding_fails_on_save(self):
+        """Test that an unknown encoding is reported when saving, not on init."""
+        exporter = TextExporter(encoding='no-such-encoding')
+        output_path = Path(self.temp_dir) / "encoded.txt"
+        
+        with pytest.raises(FileSystemError):
+            exporter.save_as_txt("text", str(output_path))
@@ -6,31 +6,89 @@ including model loading, single file transcription, and batch processing.
 """
 
 import os
-import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, MagicMock, call
 
 import pytest
 
 from src.speech_to_text.exceptions import ModelLoadError, TranscriptionError
 from src.speech_to_text.models import TranscriptionResult
-from src.speech_to_text.transcriber import SpeechTranscriber
+from src.speech_to_text.transcriber import SpeechTranscriber, ModelCache
+
+
+@pytest.fixture(scope="module")
+def whisper_patch():
+    """Patch whisper.load_model once for the whole module."""
+    patcher = patch('src.speech_to_text.transcriber.whisper.load_model')
+    mock_load = patcher.start()
+    yield mock_load
+    patcher.stop()
+
+
+@pytest.fixture(autouse=True)
+def reset_whisper(whisper_patch):
+    """Load a plain stub model by default and start from an empty model cache."""
+    whisper_patch.reset_mock(return_value=True, side_effect=True)
+    # Tests that never call into the model only need an object to hold on to
+    whisper_patch.return_value = SimpleNamespace()
+    ModelCache().clear_cache()
+
+
+@pytest.fixture(scope="module")
+def shared_whisper_model():
+    """Mock Whisper model shared by every test that transcribes."""
+    return MagicMock()
+
+
+@pytest.fixture
+def whisper_model(whisper_patch, shared_whisper_model):
+    """Make load_model return the shared mock model, reset for this test."""
+    shared_whisper_model.reset_mock(return_value=True, side_effect=True)
+    whisper_patch.return_value = shared_whisper_model
+    return shared_whisper_model
+
+
+@pytest.fixture(scope="module")
+def transcriber(whisper_patch, shared_whisper_model):
+    """SpeechTranscriber built once on the shared mock model."""
+    # Drop anything a test before first use left on the patched loader
+    whisper_patch.reset_mock(return_value=True, side_effect=True)
+    whisper_patch.return_value = shared_whisper_model
+    return SpeechTranscriber("base", use_cache=False)
+
+
+# Stat result of a small regular file, for paths that do not exist on disk
+_FAKE_AUDIO_STAT = os.stat_result((0o100644, 0, 0, 1, 0, 0, 1024, 0, 0, 0))
+
+
+@pytest.fixture
+def fake_audio_paths(monkeypatch):
+    """Audio paths that pass the transcriber's existence check without disk I/O."""
+    original_stat = Path.stat
+    fake_root = Path("/fake")
+    
+    def fake_stat(self, **kwargs):
+        # Only paths under /fake are faked; everything else hits the disk
+        if fake_root in self.parents:
+            return _FAKE_AUDIO_STAT
+        return original_stat(self, **kwargs)
+    
+    monkeypatch.setattr(Path, "stat", fake_stat)
+    return [str(fake_root / f"audio_{i}.wav") for i in range(3)]
 
 
 class TestSpeechTranscriber:
     """Test cases for the SpeechTranscriber class."""
     
-    def test_init_with_valid_model_size(self):
-        """Test initialization with valid model sizes."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            mock_load.return_value = Mock()
-            
-            for model_size in SpeechTranscriber.AVAILABLE_MODELS:
-                transcriber = SpeechTranscriber(model_size)
-                assert transcriber.model_size == model_size
-                assert transcriber._model is not None
+    @pytest.mark.parametrize("model_size", SpeechTranscriber.AVAILABLE_MODELS)
+    def test_init_with_valid_model_size(self, model_size):
+        """Test initialization with each valid model size."""
+        transcriber = SpeechTranscriber(model_size)
+        assert transcriber.model_size == model_size
+        assert transcriber._model is not None
     
     def test_init_with_invalid_model_size(self):
         """Test initialization with invalid model size raises ValueError."""
@@ -42,271 +100,180 @@ class TestSpeechTranscriber:
     
     def test_init_default_model_size(self):
         """Test initialization with default model size."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            mock_load.return_value = Mock()
-            
-            transcriber = SpeechTranscriber()
-            assert transcriber.model_size == "base"
+        transcriber = SpeechTranscriber()
+        assert transcriber.model_size == "base"
     
-    def test_model_load_failure(self):
+    def test_model_load_failure(self, whisper_patch):
         """Test that ModelLoadError is raised when model loading fails."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            mock_load.side_effect = Exception("Model loading failed")
-            
-            with pytest.raises(ModelLoadError) as exc_info:
-                SpeechTranscriber("base")
-            
-            assert "Failed to load Whisper model 'base'" in str(exc_info.value)
-            assert "Model loading failed" in str(exc_info.value)
+        whisper_patch.side_effect = Exception("Model loading failed")
+        
+        with pytest.raises(ModelLoadError) as exc_info:
+            SpeechTranscriber("base")
+        
+        assert "Failed to load Whisper model 'base'" in str(exc_info.value)
+        assert "Model loading failed" in str(exc_info.value)
     
-    def test_transcribe_file_success(self):
+    def test_transcribe_file_success(self, transcriber, whisper_model, tmp_path):
         """Test successful transcription of a single file."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            # Mock the Whisper model
-            mock_model = Mock()
-            mock_model.transcribe.return_value = {
-                "text": "안녕하세요. 이것은 테스트 음성입니다."
-            }
-            mock_load.return_value = mock_model
-            
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
-            
-            try:
-                transcriber = SpeechTranscriber("base")
-                result = transcriber.transcribe_file(temp_path, "ko")
-                
-                # Verify the result
-                assert isinstance(result, TranscriptionResult)
-                assert result.original_file == str(Path(temp_path).resolve())
-                assert result.transcribed_text == "안녕하세요. 이것은 테스트 음성입니다."
-                assert result.language == "ko"
-                assert result.confidence_score == 0.9  # High confidence for non-empty text
-                assert result.processing_time > 0
-                assert isinstance(result.timestamp, datetime)
-                assert result.error_message is None
-                
-                # Verify model was called correctly
-                mock_model.transcribe.assert_called_once_with(
-                    str(Path(temp_path).resolve()),
-                    language="ko",
-                    verbose=False
-                )
-            
-            finally:
-                # Clean up
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+        whisper_model.transcribe.return_value = {
+            "text": "안녕하세요. 이것은 테스트 음성입니다."
+        }
+        
+        # Create a real audio file so the existence check hits the disk
+        audio_file = tmp_path / "audio.wav"
+        audio_file.touch()
+        temp_path = str(audio_file)
+        resolved_path = str(audio_file.resolve())
+        
+        result = transcriber.transcribe_file(temp_path, "ko")
+        
+        # Verify the result
+        assert isinstance(result, TranscriptionResult)
+        assert result.original_file == resolved_path
+        assert result.transcribed_text == "안녕하세요. 이것은 테스트 음성입니다."
+        assert result.language == "ko"
+        assert result.confidence_score == 0.9  # High confidence for non-empty text
+        assert result.processing_time > 0
+        assert isinstance(result.timestamp, datetime)
+        assert result.error_message is None
+        
+        # Verify model was called correctly
+        whisper_model.transcribe.assert_called_once_with(
+            resolved_path,
+            language="ko",
+            verbose=True
+        )
     
-    def test_transcribe_file_empty_result(self):
+    def test_transcribe_file_empty_result(self, transcriber, whisper_model,
+                                          fake_audio_paths):
         """Test transcription with empty result."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            # Mock the Whisper model to return empty text
-            mock_model = Mock()
-            mock_model.transcribe.return_value = {"text": ""}
-            mock_load.return_value = mock_model
-            
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
-            
-            try:
-                transcriber = SpeechTranscriber("base")
-                result = transcriber.transcribe_file(temp_path, "en")
-                
-                # Verify the result
-                assert result.transcribed_text == ""
-                assert result.language == "en"
-                assert result.confidence_score == 0.0  # Low confidence for empty text
-                assert result.error_message is None
-            
-            finally:
-                # Clean up
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+        # Mock the Whisper model to return empty text
+        whisper_model.transcribe.return_value = {"text": ""}
+        
+        result = transcriber.transcribe_file(fake_audio_paths[0], "en")
+        
+        # Verify the result
+        assert result.transcribed_text == ""
+        assert result.language == "en"
+        assert result.confidence_score == 0.0  # Low confidence for empty text
+        assert result.error_message is None
     
     def test_transcribe_file_not_found(self):
         """Test transcription with non-existent file."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            mock_load.return_value = Mock()
-            
-            transcriber = SpeechTranscriber("base")
-            
-            with pytest.raises(FileNotFoundError) as exc_info:
-                transcriber.transcribe_file("/nonexistent/file.wav", "ko")
-            
-            assert "Audio file not found" in str(exc_info.value)
+        transcriber = SpeechTranscriber("base")
+        
+        with pytest.raises(FileNotFoundError) as exc_info:
+            transcriber.transcribe_file("/nonexistent/file.wav", "ko")
+        
+        assert "Audio file not found" in str(exc_info.value)
     
-    def test_transcribe_file_with_exception(self):
+    def test_transcribe_file_with_exception(self, transcriber, whisper_model,
+                                            fake_audio_paths):
         """Test transcription when Whisper raises an exception."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            # Mock the Whisper model to raise an exception
-            mock_model = Mock()
-            mock_model.transcribe.side_effect = Exception("Transcription failed")
-            mock_load.return_value = mock_model
-            
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
-            
-            try:
-                transcriber = SpeechTranscriber("base")
-                result = transcriber.transcribe_file(temp_path, "ko")
-                
-                # Verify the result contains error information
-                assert result.transcribed_text == ""
-                assert result.confidence_score == 0.0
-                assert result.error_message == "Transcription failed"
-                assert result.processing_time > 0
-            
-            finally:
-                # Clean up
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+        # Mock the Whisper model to raise an exception
+        whisper_model.transcribe.side_effect = Exception("Transcription failed")
+        
+        result = transcriber.transcribe_file(fake_audio_paths[0], "ko")
+        
+        # Verify the result contains error information
+        assert result.transcribed_text == ""
+        assert result.confidence_score == 0.0
+        assert result.error_message == "Transcription failed"
+        assert result.processing_time > 0
     
-    def test_transcribe_batch_success(self):
+    def test_transcribe_batch_success(self, transcriber, whisper_model,
+                                      fake_audio_paths):
         """Test successful batch transcription."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            # Mock the Whisper model
-            mock_model = Mock()
-            mock_model.transcribe.side_effect = [
-                {"text": "첫 번째 파일입니다."},
-                {"text": "두 번째 파일입니다."},
-                {"text": "세 번째 파일입니다."}
-            ]
-            mock_load.return_value = mock_model
-            
-            # Create temporary files
-            temp_files = []
-            for i in range(3):
-                temp_file = tempfile.NamedTemporaryFile(suffix=f"_{i}.wav", delete=False)
-                temp_files.append(temp_file.name)
-                temp_file.close()
-            
-            try:
-                transcriber = SpeechTranscriber("base")
-                results = transcriber.transcribe_batch(temp_files, "ko")
-                
-                # Verify the results
-                assert len(results) == 3
-                
-                expected_texts = [
-                    "첫 번째 파일입니다.",
-                    "두 번째 파일입니다.",
-                    "세 번째 파일입니다."
-                ]
-                
-                for i, result in enumerate(results):
-                    assert isinstance(result, TranscriptionResult)
-                    assert result.transcribed_text == expected_texts[i]
-                    assert result.language == "ko"
-                    assert result.confidence_score == 0.9
-                    assert result.error_message is None
-                
-                # Verify model was called for each file
-                assert mock_model.transcribe.call_count == 3
-            
-            finally:
-                # Clean up
-                for temp_file in temp_files:
-                    if os.path.exists(temp_file):
-                        os.unlink(temp_file)
+        whisper_model.transcribe.side_effect = [
+            {"text": "첫 번째 파일입니다."},
+            {"text": "두 번째 파일입니다."},
+            {"text": "세 번째 파일입니다."}
+        ]
+        
+        results = transcriber.transcribe_batch(fake_audio_paths, "ko")
+        
+        expected_texts = [
+            "첫 번째 파일입니다.",
+            "두 번째 파일입니다.",
+            "세 번째 파일입니다."
+        ]
+        
+        # Compare every result in one structural assertion; fake paths are
+        # already absolute, so resolving leaves them unchanged
+        actual = [
+            (type(r), r.original_file, r.transcribed_text, r.language,
+             r.confidence_score, r.error_message)
+            for r in results
+        ]
+        assert actual == [
+            (TranscriptionResult, path, text, "ko", 0.9, None)
+            for path, text in zip(fake_audio_paths, expected_texts)
+        ]
+        
+        # Verify model was called for each file
+        assert whisper_model.transcribe.call_count == 3
     
-    def test_transcribe_batch_with_progress_callback(self):
+    def test_transcribe_batch_with_progress_callback(self, transcriber, whisper_model,
+                                                     fake_audio_paths):
         """Test batch transcription with progress callback."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            # Mock the Whisper model
-            mock_model = Mock()
-            mock_model.transcribe.return_value = {"text": "테스트 텍스트"}
-            mock_load.return_value = mock_model
-            
-            # Create temporary files
-            temp_files = []
-            for i in range(2):
-                temp_file = tempfile.NamedTemporaryFile(suffix=f"_{i}.wav", delete=False)
-                temp_files.append(temp_file.name)
-                temp_file.close()
-            
-            # Mock progress callback
-            progress_callback = Mock()
-            
-            try:
-                transcriber = SpeechTranscriber("base")
-                results = transcriber.transcribe_batch(
-                    temp_files, 
-                    "ko", 
-                    progress_callback=progress_callback
-                )
-                
-                # Verify results
-                assert len(results) == 2
-                
-                # Verify progress callback was called correctly
-                expected_calls = [
-                    ((0, 2, temp_files[0]),),  # First file
-                    ((1, 2, temp_files[1]),),  # Second file
-                    ((2, 2, "Batch processing complete"),)  # Completion
-                ]
-                
-                assert progress_callback.call_count == 3
-                for i, expected_call in enumerate(expected_calls):
-                    actual_call = progress_callback.call_args_list[i]
-                    assert actual_call[0] == expected_call[0]
-            
-            finally:
-                # Clean up
-                for temp_file in temp_files:
-                    if os.path.exists(temp_file):
-                        os.unlink(temp_file)
+        whisper_model.transcribe.return_value = {"text": "테스트 텍스트"}
+        temp_files = fake_audio_paths[:2]
+        
+        # Mock progress callback
+        progress_callback = Mock()
+        
+        results = transcriber.transcribe_batch(
+            temp_files,
+            "ko",
+            progress_callback=progress_callback
+        )
+        
+        # Verify results
+        assert len(results) == 2
+        
+        # Verify progress callback was called correctly
+        assert progress_callback.call_args_list == [
+            call(0, 2, temp_files[0]),  # First file
+            call(1, 2, temp_files[1]),  # Second file
+            call(2, 2, "Batch processing complete")  # Completion
+        ]
     
-    def test_transcribe_batch_empty_list(self):
+    def test_transcribe_batch_empty_list(self, transcriber):
         """Test batch transcription with empty file list."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            mock_load.return_value = Mock()
-            
-            transcriber = SpeechTranscriber("base")
-            results = transcriber.transcribe_batch([], "ko")
-            
-            assert results == []
+        results = transcriber.transcribe_batch([], "ko")
+        
+        assert results == []
     
-    def test_model_property(self):
+    def test_model_property(self, whisper_patch):
         """Test the model property."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            mock_model = Mock()
-            mock_load.return_value = mock_model
-            
-            transcriber = SpeechTranscriber("base")
-            assert transcriber.model is mock_model
+        transcriber = SpeechTranscriber("base")
+        assert transcriber.model is whisper_patch.return_value
     
     def test_get_model_info(self):
         """Test getting model information."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            mock_load.return_value = Mock()
-            
-            transcriber = SpeechTranscriber("small")
-            info = transcriber.get_model_info()
-            
-            expected_info = {
-                "model_size": "small",
-                "is_loaded": True,
-                "available_models": ["tiny", "base", "small", "medium", "large"]
-            }
-            
-            assert info == expected_info
+        transcriber = SpeechTranscriber("small")
+        info = transcriber.get_model_info()
+        
+        expected_info = {
+            "model_size": "small",
+            "is_loaded": True,
+            "available_models": ["tiny", "base", "small", "medium", "large"],
+            "use_cache": True,
+            "cached_models": ["small"],
+            "cache_size": 1
+        }
+        
+        assert info == expected_info
     
     def test_get_model_info_not_loaded(self):
         """Test getting model information when model is not loaded."""
-        with patch('src.speech_to_text.transcriber.whisper.load_model') as mock_load:
-            mock_load.return_value = Mock()
-            
-            transcriber = SpeechTranscriber("base")
-            transcriber._model = None  # Simulate unloaded model
-            
-            info = transcriber.get_model_info()
-            assert info["is_loaded"] is False
+        transcriber = SpeechTranscriber("base")
+        transcriber._model = None  # Simulate unloaded model
+        
+        info = transcriber.get_model_info()
+        assert info["is_loaded"] is False
     
     def test_available_models_constant(self):
         """Test that AVAILABLE_MODELS constant contains expected models."""
         expected_models = ["tiny", "base", "small", "medium", "large"]
-        assert SpeechTranscriber.AVAILABLE_MODELS == expected_models
\ No newline at end of file
+        assert SpeechTranscriber.AVAILABLE_MODELS == expected_models